@@ -1,4 +1,8 @@
 import itertools
+from collections import deque
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 def window(seq, n=2):
@@ -13,3 +17,115 @@ def window(seq, n=2):
     for elem in it:
         result = result[1:] + (elem,)
         yield result
+
+
+class RunningWindow:
+    """a window of width n backed by a ring buffer.
+    advancing is O(1) and the sum, min and max of the window
+    are kept up to date as values enter and leave it"""
+
+    def __init__(self, n=2):
+        self.width = n
+        self.values = deque(maxlen=n)
+        self.sum = 0
+        self.seen = 0
+        # monotonic queues of (position, value).
+        # the head of each is the min or max of the current window
+        self.lowest = deque()
+        self.highest = deque()
+
+    def advance(self, elem):
+        if self.full:
+            self.sum -= self.values[0]
+        self.values.append(elem)
+        self.sum += elem
+
+        position = self.seen
+        self.seen += 1
+        oldest_kept = position - self.width
+
+        while self.lowest and self.lowest[-1][1] >= elem:
+            self.lowest.pop()
+        self.lowest.append((position, elem))
+        if self.lowest[0][0] <= oldest_kept:
+            self.lowest.popleft()
+
+        while self.highest and self.highest[-1][1] <= elem:
+            self.highest.pop()
+        self.highest.append((position, elem))
+        if self.highest[0][0] <= oldest_kept:
+            self.highest.popleft()
+
+        return self
+
+    @property
+    def full(self):
+        return len(self.values) == self.width
+
+    @property
+    def min(self):
+        return self.lowest[0][1]
+
+    @property
+    def max(self):
+        return self.highest[0][1]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"RunningWindow: {tuple(self.values)}"
+
+
+def running_windows(seq, n=2):
+    """like window but yields the same RunningWindow each step,
+    so consumers can read its aggregates instead of re-summing"""
+    w = RunningWindow(n)
+    for elem in seq:
+        if w.advance(elem).full:
+            yield w
+
+
+def window_view(seq, n=2):
+    """the vectorised version of window.
+    returns a zero-copy 2d view over seq as an int array,
+    with one row per window of width n"""
+    return sliding_window_view(np.asarray(seq, dtype=np.int64), n)
+
+
+def window_sums(seq, n=2):
+    return window_view(seq, n).sum(axis=1)
+
+
+def window_mins(seq, n=2):
+    return window_view(seq, n).min(axis=1)
+
+
+def window_maxes(seq, n=2):
+    return window_view(seq, n).max(axis=1)
+
+
+def pairwise_sum_membership(seq, n=2, batch_size=4096):
+    """for every value after the first n,
+    is it the sum of two different entries of the n values before it?
+    the n x n pair sums are built batch_size windows at a time
+    so memory stays bounded for long inputs"""
+    values = np.asarray(seq, dtype=np.int64)
+    if len(values) <= n:
+        return np.zeros(0, dtype=bool)
+
+    preambles = window_view(values[:-1], n)
+    targets = values[n:]
+    different_entries = ~np.eye(n, dtype=bool)
+
+    results = []
+    for start in range(0, len(targets), batch_size):
+        batch = preambles[start:start + batch_size]
+        pair_sums = batch[:, :, None] + batch[:, None, :]
+        hits = pair_sums == targets[start:start + batch_size, None, None]
+        results.append((hits & different_entries).any(axis=(1, 2)))
+
+    return np.concatenate(results)
@@ -0,0 +1,150 @@
+import itertools
+import re
+from array import array
+from functools import lru_cache
+
+from files.reader import read_lines
+
+# a boarding pass is a binary number, F and L are 0, B and R are 1
+seat_bits = str.maketrans("FBLR", "0101")
+seat_bytes = bytes.maketrans(b"FBLR", b"0101")
+# seven rows letters then three column letters
+boarding_pass_pattern = re.compile("[FB]{7}[LR]{3}")
+boarding_pass_bytes_pattern = re.compile(b"[FB]{7}[LR]{3}")
+
+
+def decode_seat_id(boarding_pass: str) -> int:
+    if not boarding_pass_pattern.fullmatch(boarding_pass):
+        raise ValueError(f"{boarding_pass} is not a boarding pass")
+    return int(boarding_pass.translate(seat_bits), 2)
+
+
+def _decode_line(line: bytes) -> int:
+    boarding_pass = line.strip()
+    if not boarding_pass_bytes_pattern.fullmatch(boarding_pass):
+        raise ValueError(f"{boarding_pass!r} is not a boarding pass")
+    return int(boarding_pass.translate(seat_bytes), 2)
+
+
+def decode_seat_ids(path: str) -> array:
+    """decodes every boarding pass in the file into an array of seat ids"""
+    return array('i', (_decode_line(line)
+                       for line in read_lines(path)
+                       if line.strip()))
+
+
+def find_missing_seats(seat_ids, number_of_seats=1024):
+    """marks each id in a bitmap as they stream past,
+    then returns every empty seat between the lowest and highest taken"""
+    taken = bytearray(number_of_seats)
+    lowest = number_of_seats
+    highest = -1
+    for seat_id in seat_ids:
+        if not 0 <= seat_id < number_of_seats:
+            raise ValueError(
+                f"seat {seat_id} is not in a cabin of {number_of_seats} seats")
+        taken[seat_id] = 1
+        if seat_id < lowest:
+            lowest = seat_id
+        if seat_id > highest:
+            highest = seat_id
+
+    missing = []
+    seat = taken.find(0, lowest, highest)
+    while seat != -1:
+        missing.append(seat)
+        seat = taken.find(0, seat + 1, highest)
+    return missing
+
+
+def find_my_seat(seat_ids):
+    """when exactly one seat is empty it is whatever is left over when the
+    taken seats are subtracted from the sum of lowest..highest.
+    None if there are no seat ids at all"""
+    lowest = None
+    highest = None
+    total = 0
+    for seat_id in seat_ids:
+        total += seat_id
+        if lowest is None or seat_id < lowest:
+            lowest = seat_id
+        if highest is None or seat_id > highest:
+            highest = seat_id
+
+    if lowest is None:
+        return None
+    every_seat = (lowest + highest) * (highest - lowest + 1) // 2
+    return every_seat - total
+
+
+@lru_cache(maxsize=None)
+def lookup_table(width, zero, one):
+    """maps every string of width zero/one letters to the number it encodes.
+    shared between every SeatMap that needs the same table"""
+    return {
+        "".join(letters): int("".join(letters)
+                              .replace(zero, "0").replace(one, "1"), 2)
+        for letters in itertools.product(zero + one, repeat=width)
+    }
+
+
+def chunked_tables(start, end, chunk_bits, zero, one):
+    chunks = []
+    for chunk_start in range(start, end, chunk_bits):
+        chunk_end = min(chunk_start + chunk_bits, end)
+        table = lookup_table(chunk_end - chunk_start, zero, one)
+        chunks.append((chunk_start, chunk_end, table))
+    return chunks
+
+
+class SeatMap:
+    """a cabin with 2 ** row_bits rows of 2 ** column_bits seats.
+    passes are decoded by looking up chunks of at most chunk_bits letters
+    in precomputed tables, so tables stay small for very big cabins"""
+
+    def __init__(self, row_bits=7, column_bits=3, chunk_bits=8):
+        self.row_bits = row_bits
+        self.column_bits = column_bits
+        self.pass_length = row_bits + column_bits
+        self.number_of_seats = 1 << self.pass_length
+        self.row_chunks = chunked_tables(0, row_bits, chunk_bits, "F", "B")
+        self.column_chunks = chunked_tables(
+            row_bits, self.pass_length, chunk_bits, "L", "R")
+
+    @staticmethod
+    def _decode(boarding_pass, chunks):
+        value = 0
+        for start, end, table in chunks:
+            chunk = boarding_pass[start:end]
+            if chunk not in table:
+                raise ValueError(f"cannot decode {chunk} from {boarding_pass}")
+            value = (value << (end - start)) | table[chunk]
+        return value
+
+    def _check_length(self, boarding_pass):
+        if len(boarding_pass) != self.pass_length:
+            raise ValueError(
+                f"{boarding_pass} is not {self.pass_length} letters long")
+
+    def row(self, boarding_pass):
+        self._check_length(boarding_pass)
+        return self._decode(boarding_pass, self.row_chunks)
+
+    def column(self, boarding_pass):
+        self._check_length(boarding_pass)
+        return self._decode(boarding_pass, self.column_chunks)
+
+    def seat_id(self, boarding_pass):
+        return ((self.row(boarding_pass) << self.column_bits)
+                | self._decode(boarding_pass, self.column_chunks))
+
+    def decode_file(self, path):
+        return array('q', (self.seat_id(line.strip().decode())
+                           for line in read_lines(path)
+                           if line.strip()))
+
+    def find_missing_seats(self, seat_ids):
+        return find_missing_seats(seat_ids, self.number_of_seats)
+
+
+standard_cabin = SeatMap(7, 3)
@@ -3,6 +3,12 @@ import unittest
 import math
 import os
 from dataclasses import dataclass
+from day_five.boarding import (decode_seat_id,
+                               decode_seat_ids,
+                               find_missing_seats,
+                               find_my_seat,
+                               SeatMap,
+                               standard_cabin)
 
 
 @dataclass
@@ -49,10 +55,7 @@ row_searcher = Searcher(0, 0, 127, "F", "B")
 
 
 def generate_id(search_string):
-    row = row_searcher.search(search_string)
-    column = column_searcher.search(search_string)
-    id = (row*8)+column
-    return id
+    return decode_seat_id(search_string)
 
 
 class DayThreeTests(unittest.TestCase):
@@ -80,6 +83,29 @@ class DayThreeTests(unittest.TestCase):
         self.assertEqual(generate_id("FFFBBBFRRR"), 119)
         self.assertEqual(generate_id("BBFFBBFRLL"), 820)
 
+    def test_decoding_agrees_with_searching(self):
+        for s in ["BFFFBBFRRR", "FFFBBBFRRR", "BBFFBBFRLL",
+                  "FFFFFFFLLL", "BBBBBBBRRR"]:
+            row = row_searcher.search(s)
+            column = column_searcher.search(s)
+            self.assertEqual(decode_seat_id(s), row * 8 + column)
+
+    def test_decoding_rejects_other_letters(self):
+        with self.assertRaises(ValueError):
+            decode_seat_id("BFFFBBFRRX")
+
+    def test_decoding_rejects_passes_of_the_wrong_shape(self):
+        for s in ["B", "", "BFFFBBFRRRR", "RRRRRRRRRR", "FBFBBFF0101",
+                  "BFFFBBRFRR", "BFFFBBFRRF"]:
+            with self.assertRaises(ValueError):
+                decode_seat_id(s)
+
+    def test_can_decode_a_whole_file(self):
+        seat_ids = decode_seat_ids(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        self.assertEqual(len(seat_ids), 824)
+        self.assertEqual(max(seat_ids), 878)
+
     def test_puzzle_input_part_one(self):
         with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
             ss = content.read().split("\n")
@@ -103,6 +129,57 @@ class DayThreeTests(unittest.TestCase):
         my_seat = candidates[0]
         self.assertEqual(my_seat, 504)
 
+    def test_can_find_every_gap(self):
+        self.assertEqual(find_missing_seats([3, 9, 4, 7, 5]), [6, 8])
+        self.assertEqual(find_missing_seats([3, 4, 5]), [])
+        self.assertEqual(
+            find_missing_seats([1, 5000], number_of_seats=8192),
+            list(range(2, 5000)))
+
+    def test_can_find_a_single_gap_by_summing(self):
+        self.assertEqual(find_my_seat([3, 5, 4, 7]), 6)
+
+    def test_no_seats_means_no_gaps(self):
+        self.assertIsNone(find_my_seat([]))
+        self.assertEqual(find_missing_seats([]), [])
+
+    def test_seats_outside_the_cabin_are_an_error(self):
+        with self.assertRaisesRegex(ValueError, "seat 1024"):
+            find_missing_seats([3, 1024])
+        with self.assertRaisesRegex(ValueError, "seat -1"):
+            find_missing_seats([-1, 3])
+
+    def test_puzzle_input_part_two_in_one_pass(self):
+        seat_ids = decode_seat_ids(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        self.assertEqual(find_missing_seats(seat_ids), [504])
+        self.assertEqual(find_my_seat(seat_ids), 504)
+
+    def test_standard_cabin_decodes_rows_and_columns(self):
+        self.assertEqual(standard_cabin.row("BFFFBBFRRR"), 70)
+        self.assertEqual(standard_cabin.column("BFFFBBFRRR"), 7)
+        self.assertEqual(standard_cabin.seat_id("BBFFBBFRLL"), 820)
+
+    def test_standard_cabin_rejects_bad_passes(self):
+        with self.assertRaises(ValueError):
+            standard_cabin.seat_id("BFFFBBFRRRR")
+        with self.assertRaises(ValueError):
+            standard_cabin.seat_id("BFFFBBFRRX")
+
+    def test_bigger_cabins_decode_in_chunks(self):
+        cabin = SeatMap(row_bits=11, column_bits=4, chunk_bits=4)
+        boarding_pass = "BFFFFFFFFFB" + "RLLR"
+        self.assertEqual(cabin.row(boarding_pass), 1025)
+        self.assertEqual(cabin.column(boarding_pass), 9)
+        self.assertEqual(cabin.seat_id(boarding_pass), 1025 * 16 + 9)
+        self.assertEqual(cabin.number_of_seats, 1 << 15)
+
+    def test_standard_cabin_with_puzzle_input(self):
+        seat_ids = standard_cabin.decode_file(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        self.assertEqual(max(seat_ids), 878)
+        self.assertEqual(standard_cabin.find_missing_seats(seat_ids), [504])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,37 @@
+"""times passport validators against each other.
+
+    python -m day_four.benchmark [number_of_passports]
+
+passports are the puzzle input repeated to the requested length"""
+import itertools
+import os
+import sys
+import timeit
+
+from day_four.day_four_tests import parse, PartTwoValidator
+from day_four.passport import AdaptiveValidator, passport_is_valid
+from files.reader import get_puzzle_input_path
+
+validators = {
+    'PartTwoValidator': PartTwoValidator.validate,
+    'rule table': passport_is_valid,
+    'adaptive': AdaptiveValidator().validate,
+}
+
+
+def main(number_of_passports):
+    with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+        puzzle_input = parse(content.read())
+    passports = list(itertools.islice(itertools.cycle(puzzle_input),
+                                      number_of_passports))
+
+    for name, validate in validators.items():
+        seconds = timeit.timeit(
+            lambda: sum(1 for p in passports if validate(p)),
+            number=1)
+        print(f"{name:>20}: {seconds * 1000:10.3f} ms "
+              f"for {number_of_passports} passports")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -1,7 +1,19 @@
-from files.reader import get_puzzle_input_path, split_grouped_input
+from files.reader import (get_puzzle_input_path,
+                          iter_grouped_input,
+                          split_grouped_input)
 import unittest
-import re
 import os
+import random
+from day_four.passport import (AdaptiveValidator,
+                               count_valid_passports,
+                               field_is_valid,
+                               has_required_fields,
+                               hcl_pattern,
+                               passport_is_valid,
+                               pid_pattern,
+                               rejection_reason,
+                               scan_passports,
+                               validate_passports_in_parallel)
 
 
 class PartTwoValidator(object):
@@ -48,10 +60,7 @@ class pid(object):
 
     @classmethod
     def parse(class_, s):
-        pattern = "^[0-9]{9}$"
-        regex = re.compile(pattern)
-        match = regex.search(s)
-        if match:
+        if pid_pattern.fullmatch(s):
             return pid(s)
         else:
             return None
@@ -69,10 +78,7 @@ class hcl(object):
 
     @classmethod
     def parse(class_, s):
-        pattern = "^#[0-9a-f]{6}$"
-        regex = re.compile(pattern)
-        match = regex.search(s)
-        if match:
+        if hcl_pattern.fullmatch(s):
             return hcl(s)
         else:
             return None
@@ -189,15 +195,7 @@ def parse(input):
 
 
 def is_valid_passport(p):
-    return all([
-        "byr" in p,
-        "iyr" in p,
-        "eyr" in p,
-        "hgt" in p,
-        "hcl" in p,
-        "ecl" in p,
-        "pid" in p
-    ])
+    return has_required_fields(p)
 
 
 class DayThreeTests(unittest.TestCase):
@@ -232,6 +230,13 @@ iyr:2011 ecl:brn hgt:59in
         # print(valid_passports)
         self.assertEqual(len(valid_passports), 228)
 
+    def test_read_passwords_streamed_from_puzzle_input(self):
+        with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+            valid_passports = sum(
+                1 for s in iter_grouped_input(content)
+                if is_valid_passport(parse_passport_string(s)))
+        self.assertEqual(valid_passports, 228)
+
     def test_byr_validation(self):
         self.assertIsNone(byr.parse('1919'))
         [self.assertIsNotNone(byr.parse(str(n))) for n in range(1920, 2003)]
@@ -312,6 +317,124 @@ pid:3556412378 byr:2007
         # print(valid_passports)
         self.assertEqual(len(valid_passports), 175)
 
+    def test_field_rule_table(self):
+        self.assertTrue(field_is_valid("byr", "2002"))
+        self.assertFalse(field_is_valid("byr", "2003"))
+        self.assertFalse(field_is_valid("byr", "02002"))
+        self.assertFalse(field_is_valid("byr", "١٩٨٠"))
+        self.assertFalse(field_is_valid("iyr", "20²0"))
+        self.assertFalse(field_is_valid("eyr", "20²5"))
+        self.assertTrue(field_is_valid("hgt", "60in"))
+        self.assertTrue(field_is_valid("hgt", "190cm"))
+        self.assertFalse(field_is_valid("hgt", "190in"))
+        self.assertFalse(field_is_valid("hgt", "190"))
+        self.assertFalse(field_is_valid("hgt", "cm"))
+        self.assertTrue(field_is_valid("hcl", "#123abc"))
+        self.assertFalse(field_is_valid("hcl", "#123abz"))
+        self.assertFalse(field_is_valid("hcl", "123abc"))
+        self.assertTrue(field_is_valid("ecl", "brn"))
+        self.assertFalse(field_is_valid("ecl", "wat"))
+        self.assertTrue(field_is_valid("pid", "000000001"))
+        self.assertFalse(field_is_valid("pid", "0123456789"))
+
+    def test_rule_table_agrees_with_part_two_validator(self):
+        with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+            ss = content.read()
+        for p in parse(ss):
+            self.assertEqual(passport_is_valid(p),
+                             PartTwoValidator.validate(p))
+
+    def test_adaptive_validator_tries_most_failed_fields_first(self):
+        validator = AdaptiveValidator(reorder_every=3)
+        good = {"byr": "1980", "iyr": "2012", "eyr": "2030", "hgt": "74in",
+                "hcl": "#623a2f", "ecl": "grn", "pid": "087499704"}
+        bad_pid = dict(good, pid="1")
+        missing_pid = dict(good)
+        del missing_pid["pid"]
+
+        self.assertTrue(validator.validate(good))
+        self.assertFalse(validator.validate(bad_pid))
+        self.assertFalse(validator.validate(missing_pid))
+
+        self.assertEqual(validator.failures["pid"], 1)
+        self.assertEqual(validator.missing_fields, 1)
+        self.assertEqual(validator.order[0][0], "pid")
+
+    def test_adaptive_validator_orders_by_failure_rate_not_count(self):
+        """byr is checked first so starts out seeing every failure,
+        pid fails more often but is only checked when byr passes"""
+        rng = random.Random(2020)
+        good = {"byr": "1980", "iyr": "2012", "eyr": "2030", "hgt": "74in",
+                "hcl": "#623a2f", "ecl": "grn", "pid": "087499704"}
+        validator = AdaptiveValidator(reorder_every=100)
+        for _ in range(20000):
+            passport = dict(good)
+            if rng.random() < 0.5:
+                passport["byr"] = "1900"
+            if rng.random() < 0.6:
+                passport["pid"] = "1"
+            validator.validate(passport)
+
+        self.assertEqual([f for f, _ in validator.order[:2]], ["pid", "byr"])
+        self.assertAlmostEqual(validator.failure_rate("pid"), 0.6, delta=0.02)
+        self.assertAlmostEqual(validator.failure_rate("byr"), 0.5, delta=0.02)
+
+    def test_adaptive_validator_with_puzzle_input(self):
+        with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+            ss = content.read()
+        validator = AdaptiveValidator(reorder_every=10)
+        valid_passports = [p for p in parse(ss) if validator.validate(p)]
+        self.assertEqual(len(valid_passports), 175)
+
+    def test_can_scan_passports_from_lines(self):
+        scanned = list(scan_passports("""
+ecl:gry pid:860033327
+byr:1937
+
+hcl:#cfa07d byr:1929
+""".splitlines()))
+        self.assertEqual(scanned, [
+            [("ecl", "gry"), ("pid", "860033327"), ("byr", "1937")],
+            [("hcl", "#cfa07d"), ("byr", "1929")]
+        ])
+
+    def test_scanned_passports_need_every_required_field(self):
+        self.assertEqual(count_valid_passports(self.example_input
+                                               .splitlines()), 2)
+
+    def test_scan_puzzle_input_part_two(self):
+        with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+            self.assertEqual(count_valid_passports(content), 175)
+
+    def test_rejection_reasons(self):
+        fields = [("byr", "1980"), ("iyr", "2012"), ("eyr", "2030"),
+                  ("hgt", "74in"), ("hcl", "#623a2f"), ("ecl", "grn"),
+                  ("pid", "087499704"), ("cid", "1")]
+        self.assertIsNone(rejection_reason(fields))
+        self.assertEqual(rejection_reason(fields[:5]), ("ecl", "missing"))
+        self.assertEqual(rejection_reason([("hgt", "1in")] + fields),
+                         ("hgt", "invalid"))
+
+    def test_non_ascii_digits_are_rejected_not_raised(self):
+        passport = ["byr:19²0 iyr:2012 eyr:2030 hgt:74in",
+                    "hcl:#623a2f ecl:grn pid:087499704"]
+        self.assertEqual(count_valid_passports(passport), 0)
+        self.assertEqual(rejection_reason(next(scan_passports(passport))),
+                         ("byr", "invalid"))
+        report = validate_passports_in_parallel(passport, workers=1)
+        self.assertEqual(report.valid, 0)
+        self.assertEqual(dict(report.rejections), {("byr", "invalid"): 1})
+
+    def test_parallel_validation_of_puzzle_input(self):
+        with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+            report = validate_passports_in_parallel(
+                content, workers=2, batch_size=25)
+        with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+            passports = list(scan_passports(content))
+        self.assertEqual(report.valid, 175)
+        self.assertEqual(sum(report.rejections.values()),
+                         len(passports) - 175)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,217 @@
+import dataclasses
+import itertools
+import os
+import re
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+pid_pattern = re.compile("[0-9]{9}")
+hcl_pattern = re.compile("#[0-9a-f]{6}")
+hgt_pattern = re.compile("([0-9]+)(cm|in)")
+year_pattern = re.compile("[0-9]{4}")
+
+eye_colours = frozenset(["amb", "blu", "brn", "gry", "grn", "hzl", "oth"])
+
+height_ranges = {
+    "cm": (150, 193),
+    "in": (59, 76)
+}
+
+
+def year_between(lower, upper):
+    def rule(s):
+        return (year_pattern.fullmatch(s) is not None
+                and lower <= int(s) <= upper)
+    return rule
+
+
+def height_is_valid(s):
+    match = hgt_pattern.fullmatch(s)
+    if match is None:
+        return False
+    lower, upper = height_ranges[match.group(2)]
+    return lower <= int(match.group(1)) <= upper
+
+
+def hair_colour_is_valid(s):
+    return hcl_pattern.fullmatch(s) is not None
+
+
+def passport_id_is_valid(s):
+    return pid_pattern.fullmatch(s) is not None
+
+
+# every required field and the rule its value must pass.
+# built once when the module loads
+field_rules = {
+    "byr": year_between(1920, 2002),
+    "iyr": year_between(2010, 2020),
+    "eyr": year_between(2020, 2030),
+    "hgt": height_is_valid,
+    "hcl": hair_colour_is_valid,
+    "ecl": eye_colours.__contains__,
+    "pid": passport_id_is_valid
+}
+
+
+required_fields = tuple(field_rules)
+field_bits = {field: 1 << i for i, field in enumerate(required_fields)}
+all_field_bits = (1 << len(required_fields)) - 1
+
+
+def has_required_fields(passport):
+    for field in required_fields:
+        if field not in passport:
+            return False
+    return True
+
+
+def field_is_valid(field, value):
+    return field_rules[field](value)
+
+
+def passport_is_valid(passport):
+    for field, rule in field_rules.items():
+        value = passport.get(field)
+        if value is None or not rule(value):
+            return False
+    return True
+
+
+def scan_passports(lines):
+    """reads the lines once, e.g. straight from an open file,
+    and yields each passport as a list of (key, value) pairs.
+    no joined passport strings or dicts are built along the way"""
+    fields = []
+    for line in lines:
+        tokens = line.split()
+        if not tokens:
+            if fields:
+                yield fields
+                fields = []
+            continue
+        for token in tokens:
+            key, _, value = token.partition(":")
+            fields.append((key, value))
+
+    if fields:
+        yield fields
+
+
+def rejection_reason(fields):
+    """validates scanned (key, value) pairs as they come,
+    tracking which required fields have been seen in a bitmask.
+    returns None for a valid passport, otherwise which field rejected it
+    as (field, "invalid") or (field, "missing")"""
+    seen = 0
+    for key, value in fields:
+        rule = field_rules.get(key)
+        if rule is not None:
+            if not rule(value):
+                return (key, "invalid")
+            seen |= field_bits[key]
+
+    if seen != all_field_bits:
+        for required in required_fields:
+            if not seen & field_bits[required]:
+                return (required, "missing")
+    return None
+
+
+def fields_are_valid(fields):
+    return rejection_reason(fields) is None
+
+
+def count_valid_passports(lines):
+    return sum(1 for fields in scan_passports(lines)
+               if fields_are_valid(fields))
+
+
+class AdaptiveValidator:
+    """checks the required keys are present before checking any values,
+    then stops at the first failing field.
+    fields are tried in order of the rate they have failed at so far,
+    re-sorted every reorder_every passports. a field is only checked when
+    every field ahead of it passed, so raw failure counts would favour
+    whichever fields happen to be checked first"""
+
+    def __init__(self, reorder_every=1000):
+        self.reorder_every = reorder_every
+        self.validated = 0
+        self.missing_fields = 0
+        self.failures = dict.fromkeys(field_rules, 0)
+        self.checks = dict.fromkeys(field_rules, 0)
+        self.order = list(field_rules.items())
+
+    def failure_rate(self, field):
+        checks = self.checks[field]
+        return self.failures[field] / checks if checks else 0
+
+    def reorder(self):
+        self.order.sort(key=lambda rule: self.failure_rate(rule[0]),
+                        reverse=True)
+
+    def validate(self, passport):
+        self.validated += 1
+        if self.validated % self.reorder_every == 0:
+            self.reorder()
+
+        if not has_required_fields(passport):
+            self.missing_fields += 1
+            return False
+
+        for field, rule in self.order:
+            self.checks[field] += 1
+            if not rule(passport[field]):
+                self.failures[field] += 1
+                return False
+        return True
+
+
+@dataclasses.dataclass
+class ValidationReport:
+    valid: int = 0
+    rejections: Counter = dataclasses.field(default_factory=Counter)
+
+    def add(self, other):
+        self.valid += other.valid
+        self.rejections.update(other.rejections)
+        return self
+
+
+def validate_batch(batch):
+    report = ValidationReport()
+    for fields in batch:
+        reason = rejection_reason(fields)
+        if reason is None:
+            report.valid += 1
+        else:
+            report.rejections[reason] += 1
+    return report
+
+
+def batches_of(iterable, size):
+    it = iter(iterable)
+    batch = list(itertools.islice(it, size))
+    while batch:
+        yield batch
+        batch = list(itertools.islice(it, size))
+
+
+def validate_passports_in_parallel(lines, workers=None, batch_size=10000):
+    """scans passports from the lines and validates them in batches
+    across a process pool. returns the valid count and a histogram
+    of the (field, reason) that rejected each invalid passport.
+    only a few batches per worker are in flight at once,
+    so memory doesn't grow with the size of the input"""
+    report = ValidationReport()
+    max_in_flight = (workers or os.cpu_count()) * 2
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+        for batch in batches_of(scan_passports(lines), batch_size):
+            in_flight.append(executor.submit(validate_batch, batch))
+            if len(in_flight) >= max_in_flight:
+                report.add(in_flight.popleft().result())
+        while in_flight:
+            report.add(in_flight.popleft().result())
+    return report
@@ -1,7 +1,8 @@
 import os
 import unittest
 import itertools
-from files.reader import get_puzzle_input_path
+import numpy as np
+from files.reader import get_puzzle_input_path, read_numbers
 import data.sliding
 
 
@@ -13,10 +14,18 @@ def get_valid_numbers_from_preamble(preamble):
     return result
 
 
-def seek_first_invalid_number(s: str, preamble_length: int):
-    input = [int(line.strip())
-             for line in s.splitlines()
-             if line and len(line.strip()) > 0]
+def numbers_from(s):
+    """accepts either the raw puzzle text or already parsed numbers,
+    e.g. from files.reader.read_numbers"""
+    if isinstance(s, str):
+        return [int(line.strip())
+                for line in s.splitlines()
+                if line and len(line.strip()) > 0]
+    return list(s)
+
+
+def seek_first_invalid_number(s, preamble_length: int):
+    input = numbers_from(s)
     windows = data.sliding.window(input, preamble_length+1)
 
     for w in windows:
@@ -34,18 +43,26 @@ def seek_first_invalid_number(s: str, preamble_length: int):
     #         in y if value not in valid_numbers]
 
 
-def find_encryption_weakness(i: str, invalid_number: int):
-    ns = [int(s.strip())
-          for s in i.splitlines() if s and len(s.strip()) > 0]
+def seek_first_invalid_number_vectorised(s, preamble_length: int):
+    ns = numbers_from(s)
+    valid = data.sliding.pairwise_sum_membership(ns, preamble_length)
+    invalid = np.flatnonzero(~valid)
+    if len(invalid) > 0:
+        return ns[invalid[0] + preamble_length]
+
 
-    match = ()
-    for i in range(2, len(ns)):
-        for x in data.sliding.window(ns, i):
-            if sum(x) == invalid_number:
-                match = x
+def find_encryption_weakness(i, invalid_number: int):
+    ns = numbers_from(i)
 
-    smallest = min(match)
-    largest = max(match)
+    match = None
+    for width in range(2, len(ns)):
+        for w in data.sliding.running_windows(ns, width):
+            if w.sum == invalid_number:
+                match = (w.min, w.max)
+
+    if match is None:
+        raise ValueError(f"no contiguous range sums to {invalid_number}")
+    smallest, largest = match
     return smallest + largest
 
 
@@ -58,6 +75,53 @@ class DayNineTests(unittest.TestCase):
             windows,
             [(1, 2, 3), (2, 3, 4), (3, 4, 5), (4, 5, 6), (5, 6, 7), (6, 7, 8)])
 
+    def test_can_run_a_window(self):
+        ss = [5, 1, 4, 2, 8, 3]
+        seen = [(tuple(w), w.sum, w.min, w.max)
+                for w in data.sliding.running_windows(ss, 3)]
+        self.assertEqual(
+            seen,
+            [((5, 1, 4), 10, 1, 5),
+             ((1, 4, 2), 7, 1, 4),
+             ((4, 2, 8), 14, 2, 8),
+             ((2, 8, 3), 13, 2, 8)])
+
+    def test_running_window_is_not_full_until_width_values_seen(self):
+        w = data.sliding.RunningWindow(3)
+        w.advance(1).advance(2)
+        self.assertFalse(w.full)
+        self.assertEqual(list(data.sliding.running_windows([1, 2], 3)), [])
+
+    def test_can_view_windows(self):
+        ss = [1, 2, 3, 4, 5, 6, 7, 8]
+        windows = data.sliding.window_view(ss, 3)
+        self.assertEqual(
+            [tuple(w) for w in windows],
+            list(data.sliding.window(ss, 3)))
+        self.assertEqual(
+            list(data.sliding.window_sums(ss, 3)),
+            [6, 9, 12, 15, 18, 21])
+        self.assertEqual(list(data.sliding.window_mins(ss, 3)),
+                         [1, 2, 3, 4, 5, 6])
+        self.assertEqual(list(data.sliding.window_maxes(ss, 3)),
+                         [3, 4, 5, 6, 7, 8])
+
+    def test_pairwise_sums_need_two_different_entries(self):
+        membership = data.sliding.pairwise_sum_membership(
+            [1, 2, 3, 4, 4, 2, 8], 3)
+        self.assertEqual(list(membership), [True, False, False, True])
+        membership = data.sliding.pairwise_sum_membership([2, 3, 5, 4], 3)
+        self.assertEqual(list(membership), [False])
+
+    def test_pairwise_sums_work_across_batches(self):
+        ns = [1, 2]
+        while len(ns) < 30:
+            ns.append(ns[-1] + ns[-2])
+        ns.append(1)
+        membership = data.sliding.pairwise_sum_membership(
+            ns, 3, batch_size=4)
+        self.assertEqual(list(membership), [True] * 27 + [False])
+
     def test_can_get_sum_of_permutations(self):
         ss = (1, 2, 3, 4, 5)
         valid_numbers = get_valid_numbers_from_preamble(ss)
@@ -105,6 +169,20 @@ class DayNineTests(unittest.TestCase):
         print(z)
         self.assertEqual(z, 375054920)
 
+    def test_part_one_from_mapped_file(self):
+        numbers = read_numbers(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+
+        z = seek_first_invalid_number(numbers, 25)
+        self.assertEqual(z, 375054920)
+
+    def test_part_one_vectorised(self):
+        numbers = read_numbers(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+
+        z = seek_first_invalid_number_vectorised(numbers, 25)
+        self.assertEqual(z, 375054920)
+
     def test_find_encryption_weakness_in_example_input(self):
         i = """35
             20
@@ -131,9 +209,20 @@ class DayNineTests(unittest.TestCase):
 
         self.assertEqual(weakness, 62)
 
+    def test_no_encryption_weakness_is_an_error(self):
+        with self.assertRaisesRegex(ValueError, "sums to 1000"):
+            find_encryption_weakness([1, 2, 3, 4, 5], 1000)
+
     def test_encryption_weakness_with_puzzle_input(self):
         with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
             puzzle_input = content.read()
         weakness = find_encryption_weakness(puzzle_input, 375054920)
 
         self.assertEqual(weakness, 54142584)
+
+    def test_encryption_weakness_from_mapped_file(self):
+        numbers = read_numbers(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        weakness = find_encryption_weakness(numbers, 375054920)
+
+        self.assertEqual(weakness, 54142584)
@@ -0,0 +1,81 @@
+"""times the expense report searches against each other.
+
+    python -m day_one.benchmark
+
+the itertools combinations search that day one started with is
+only run where the number of combinations fits comfortably in memory,
+and the pure python 3-sum only where it finishes in reasonable time"""
+import math
+import random
+import timeit
+from itertools import combinations
+
+from day_one.expenses import (k_sum,
+                              three_sum_vectorised,
+                              two_sum_vectorised)
+
+sizes = [200, 10_000, 1_000_000]
+target = 2020
+max_combinations = 5_000_000
+# pure python 3-sum is quadratic in the input once the pruning can't help
+max_python_three_sum_size = 10_000
+
+
+def combinations_search(ns, length):
+    candidates = list(combinations(ns, length))
+    xs = [combination for combination in candidates
+          if sum(combination) == target]
+    return xs[0] if xs else None
+
+
+searches = {
+    'combinations': combinations_search,
+    'k_sum': lambda ns, length: k_sum(ns, length, target),
+    'numpy': lambda ns, length: (two_sum_vectorised
+                                 if length == 2
+                                 else three_sum_vectorised)(ns, target),
+}
+
+
+def expenses(size, length, planted):
+    """noise is drawn from [0, target] but is always 1 mod 4.
+    target is 0 mod 4 and two or three noise values sum to 2 or 3 mod 4,
+    so no noise combination can match and the searches can't prune early.
+    when planted, the answer is a combination of 0 mod 4 values which
+    can't combine with noise either, and it goes last in the input"""
+    answer = [1000, 1020] if length == 2 else [500, 700, 820]
+    noise_size = size - length if planted else size
+    ns = [random.randrange(1, target, 4) for _ in range(noise_size)]
+    if planted:
+        ns += answer
+    return ns
+
+
+def should_skip(name, size, length):
+    if name == 'combinations':
+        return math.comb(size, length) > max_combinations
+    if name == 'k_sum' and length == 3:
+        return size > max_python_three_sum_size
+    return False
+
+
+def main():
+    random.seed(2020)
+    for length in (2, 3):
+        for planted in (True, False):
+            scenario = 'planted' if planted else 'no answer'
+            for size in sizes:
+                ns = expenses(size, length, planted)
+                for name, search in searches.items():
+                    label = f"{length}-sum {scenario:>9} {size:>9} {name:>12}"
+                    if should_skip(name, size, length):
+                        print(f"{label}: skipped")
+                        continue
+                    runs = 3
+                    seconds = timeit.timeit(lambda: search(ns, length),
+                                            number=runs) / runs
+                    print(f"{label}: {seconds * 1000:10.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
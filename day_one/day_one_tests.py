@@ -1,20 +1,18 @@
 from files.reader import get_puzzle_input_path
 import unittest
-from itertools import combinations
 import os
+from day_one.expenses import (ExpenseIndex,
+                              combination_that_sums,
+                              k_sum,
+                              read_numbers_from_file,
+                              three_sum,
+                              three_sum_vectorised,
+                              two_sum,
+                              two_sum_vectorised)
 
 
 def combination_that_sums_2020(ns, length):
-    candidates = list(combinations(ns, length))
-    xs = [combination for combination in candidates
-          if sum(combination) == 2020]
-    return xs[0]
-
-
-def read_numbers_from_file(f):
-    with open(f) as content:
-        lines = [line.rstrip() for line in content]
-    return [int(s) for s in lines]
+    return combination_that_sums(ns, length, 2020)
 
 
 class DayOneTests(unittest.TestCase):
@@ -62,6 +60,90 @@ class DayOneTests(unittest.TestCase):
         self.assertEqual(
             candidate[0] * candidate[1] * candidate[2], 223162626)
 
+    def test_two_sum_uses_each_entry_once(self):
+        self.assertIsNone(two_sum([1010, 1, 2], 2020))
+        self.assertEqual(two_sum([1010, 1, 1010], 2020), (1010, 1010))
+
+    def test_three_sum_to_any_target(self):
+        self.assertEqual(sorted(three_sum([5, -2, 10, 3, 7], 6)),
+                         [-2, 3, 5])
+        self.assertIsNone(three_sum([1, 2, 3], 7))
+
+    def test_k_sum_for_more_than_three_entries(self):
+        expenses = [1721, 979, 366, 299, 675, 1456]
+        combination = k_sum(expenses, 4, 1721 + 979 + 366 + 299)
+        self.assertEqual(sorted(combination), [299, 366, 979, 1721])
+        self.assertIsNone(k_sum(expenses, 4, 1))
+        self.assertIsNone(k_sum(expenses, 7, 2020))
+
+    def test_k_sum_of_one(self):
+        self.assertEqual(k_sum([1, 2, 3], 1, 2), (2,))
+        self.assertIsNone(k_sum([1, 2, 3], 1, 4))
+
+    def test_no_combination_is_an_error(self):
+        with self.assertRaises(ValueError):
+            combination_that_sums([1, 2, 3], 2, 2020)
+
+    def test_large_expense_report(self):
+        expenses = list(range(0, 300000, 3)) + [1, 5]
+        combination = combination_that_sums(expenses, 3, 7)
+        self.assertEqual(sorted(combination), [0, 1, 6])
+
+    def test_index_answers_a_batch_of_queries(self):
+        index = ExpenseIndex([1721, 979, 366, 299, 675, 1456])
+        answers = index.answer([(2020, 2), (2020, 3), (1, 2), (366, 1)])
+        self.assertEqual(answers, [
+            (299, 1721),
+            (366, 675, 979),
+            None,
+            (366,)
+        ])
+
+    def test_index_can_find_all_combinations(self):
+        index = ExpenseIndex([1, 2, 3, 4, 5, 5])
+        answers = index.answer([(6, 2), (10, 3), (10, 2), (20, 2)],
+                               find_all=True)
+        self.assertEqual(answers, [
+            [(1, 5), (2, 4)],
+            [(1, 4, 5), (2, 3, 5)],
+            [(5, 5)],
+            []
+        ])
+
+    def test_index_only_pairs_a_value_with_itself_if_it_is_repeated(self):
+        index = ExpenseIndex([1010, 3])
+        self.assertIsNone(index.first_combination(2020, 2))
+        self.assertEqual(index.all_combinations(2020, 2), [])
+
+    def test_index_from_puzzle_input(self):
+        index = ExpenseIndex.from_file(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        pair, triple = index.answer([(2020, 2), (2020, 3)])
+        self.assertEqual(pair[0] * pair[1], 55776)
+        self.assertEqual(triple[0] * triple[1] * triple[2], 223162626)
+
+    def test_vectorised_pair_search(self):
+        expenses = [1721, 979, 366, 299, 675, 1456]
+        self.assertEqual(two_sum_vectorised(expenses, 2020), (299, 1721))
+        self.assertIsNone(two_sum_vectorised([1010, 3], 2020))
+        self.assertEqual(two_sum_vectorised([1010, 3, 1010], 2020),
+                         (1010, 1010))
+
+    def test_vectorised_triple_search(self):
+        expenses = [1721, 979, 366, 299, 675, 1456]
+        self.assertEqual(three_sum_vectorised(expenses, 2020),
+                         (366, 675, 979))
+        self.assertIsNone(three_sum_vectorised([1, 2, 3], 7))
+        self.assertEqual(three_sum_vectorised([2, 2, 3], 7), (2, 2, 3))
+
+    def test_vectorised_search_of_puzzle_input(self):
+        expenses = read_numbers_from_file(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        a, b = two_sum_vectorised(expenses, 2020)
+        self.assertEqual(a * b, 55776)
+        a, b, c = three_sum_vectorised(expenses, 2020)
+        self.assertEqual(a * b * c, 223162626)
+
 
 if __name__ == '__main__':
     unittest.main()
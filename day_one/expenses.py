@@ -0,0 +1,196 @@
+from collections import Counter
+
+import numpy as np
+
+from files.reader import read_numbers
+
+
+def read_numbers_from_file(f):
+    return list(read_numbers(f))
+
+
+def two_sum(ns, target):
+    """single pass over ns remembering what has been seen,
+    so each complement lookup is a set membership check"""
+    seen = set()
+    for n in ns:
+        if target - n in seen:
+            return (target - n, n)
+        seen.add(n)
+    return None
+
+
+def _two_sum_sorted(xs, start, target):
+    low = start
+    high = len(xs) - 1
+    while low < high:
+        total = xs[low] + xs[high]
+        if total == target:
+            return (xs[low], xs[high])
+        elif total < target:
+            low += 1
+        else:
+            high -= 1
+    return None
+
+
+def _k_sum_sorted(xs, start, k, target):
+    if k == 2:
+        return _two_sum_sorted(xs, start, target)
+
+    for i in range(start, len(xs) - k + 1):
+        if i > start and xs[i] == xs[i - 1]:
+            continue
+        if sum(xs[i:i + k]) > target:
+            # every later choice is at least this big
+            break
+        if xs[i] + sum(xs[len(xs) - k + 1:]) < target:
+            # even the largest partners can't reach the target
+            continue
+
+        found = _k_sum_sorted(xs, i + 1, k - 1, target - xs[i])
+        if found:
+            return (xs[i],) + found
+
+    return None
+
+
+def _all_two_sums_sorted(xs, start, target):
+    low = start
+    high = len(xs) - 1
+    while low < high:
+        total = xs[low] + xs[high]
+        if total == target:
+            yield (xs[low], xs[high])
+            low += 1
+            while low < high and xs[low] == xs[low - 1]:
+                low += 1
+            high -= 1
+        elif total < target:
+            low += 1
+        else:
+            high -= 1
+
+
+def _all_k_sums_sorted(xs, start, k, target):
+    if k == 2:
+        yield from _all_two_sums_sorted(xs, start, target)
+        return
+
+    for i in range(start, len(xs) - k + 1):
+        if i > start and xs[i] == xs[i - 1]:
+            continue
+        if sum(xs[i:i + k]) > target:
+            break
+        if xs[i] + sum(xs[len(xs) - k + 1:]) < target:
+            continue
+
+        for found in _all_k_sums_sorted(xs, i + 1, k - 1, target - xs[i]):
+            yield (xs[i],) + found
+
+
+def three_sum(ns, target):
+    """sorts once then walks two pointers in from either end
+    for each candidate first value"""
+    return _k_sum_sorted(sorted(ns), 0, 3, target)
+
+
+def k_sum(ns, k, target):
+    """finds the first k entries of ns that sum to target.
+    returns None if there aren't any"""
+    if k < 1 or k > len(ns):
+        return None
+    if k == 1:
+        return (target,) if target in ns else None
+    if k == 2:
+        return two_sum(ns, target)
+    return _k_sum_sorted(sorted(ns), 0, k, target)
+
+
+def _pair_in_sorted_array(xs, target):
+    """looks up the complement of every candidate at once.
+    only values up to half the target can be the smaller of a pair"""
+    candidates = xs[:np.searchsorted(xs, target / 2, side='right')]
+    complements = target - candidates
+    available = (np.searchsorted(xs, complements, side='right')
+                 - np.searchsorted(xs, complements, side='left')
+                 - (complements == candidates))
+    hits = np.flatnonzero(available > 0)
+    if len(hits) == 0:
+        return None
+    first = int(candidates[hits[0]])
+    return (first, target - first)
+
+
+def two_sum_vectorised(ns, target):
+    xs = np.sort(np.asarray(ns, dtype=np.int64))
+    return _pair_in_sorted_array(xs, target)
+
+
+def three_sum_vectorised(ns, target):
+    xs = np.sort(np.asarray(ns, dtype=np.int64))
+    for i in range(len(xs) - 2):
+        if xs[i:i + 3].sum() > target:
+            break
+        if i > 0 and xs[i] == xs[i - 1]:
+            continue
+        first = int(xs[i])
+        found = _pair_in_sorted_array(xs[i + 1:], target - first)
+        if found:
+            return (first,) + found
+    return None
+
+
+def combination_that_sums(ns, length, target):
+    combination = k_sum(ns, length, target)
+    if combination is None:
+        raise ValueError(
+            f"no combination of {length} expenses sums to {target}")
+    return combination
+
+
+class ExpenseIndex:
+    """indexes an expense list once so that many (target, k) queries
+    share the cost of sorting it and counting its values"""
+
+    def __init__(self, expenses):
+        self.sorted_expenses = sorted(expenses)
+        self.counts = Counter(self.sorted_expenses)
+
+    @classmethod
+    def from_file(class_, f):
+        return class_(read_numbers_from_file(f))
+
+    def _has(self, value, times=1):
+        return self.counts[value] >= times
+
+    def first_combination(self, target, k):
+        """the combination with the smallest first value, or None"""
+        if k < 1 or k > len(self.sorted_expenses):
+            return None
+        if k == 1:
+            return (target,) if self._has(target) else None
+        if k == 2:
+            # counts was built from the sorted list so iterates ascending
+            for value in self.counts:
+                complement = target - value
+                if complement < value:
+                    break
+                times = 2 if complement == value else 1
+                if self._has(complement, times):
+                    return (value, complement)
+            return None
+        return _k_sum_sorted(self.sorted_expenses, 0, k, target)
+
+    def all_combinations(self, target, k):
+        """every distinct combination of values, each in ascending order"""
+        if k < 1 or k > len(self.sorted_expenses):
+            return []
+        if k == 1:
+            return [(target,)] if self._has(target) else []
+        return list(_all_k_sums_sorted(self.sorted_expenses, 0, k, target))
+
+    def answer(self, queries, find_all=False):
+        """answers (target, k) queries in the order given"""
+        find = self.all_combinations if find_all else self.first_combination
+        return [find(target, k) for target, k in queries]
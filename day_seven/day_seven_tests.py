@@ -43,9 +43,12 @@ class Bag:
 
     def can_be_in(self):
         bs = set()
-        bs.update(self.can_be_contained_by_bags)
-        for bag in self.can_be_contained_by_bags:
-            bs.update(bag.can_be_in())
+        to_visit = list(self.can_be_contained_by_bags)
+        while to_visit:
+            bag = to_visit.pop()
+            if bag not in bs:
+                bs.add(bag)
+                to_visit.extend(bag.can_be_contained_by_bags)
 
         return frozenset(bs)
 
@@ -102,6 +105,55 @@ class Bag:
         return bags
 
 
+class BagGraph:
+    """orders the bags once so that every bag comes before the bags it
+    contains, then caches each bag's ancestors (walking the order forwards)
+    and nested count (walking it backwards).
+    queries are then lookups, however many colours are asked about"""
+
+    def __init__(self, bags: typing.Dict[str, Bag]):
+        self.bags = bags
+        self.order = BagGraph.topological_order(bags.values())
+
+        self.ancestors: typing.Dict[Bag, frozenset] = {}
+        for bag in self.order:
+            ancestors = set(bag.can_be_contained_by_bags)
+            for parent in bag.can_be_contained_by_bags:
+                ancestors.update(self.ancestors[parent])
+            self.ancestors[bag] = frozenset(ancestors)
+
+        self.nested_counts: typing.Dict[Bag, int] = {}
+        for bag in reversed(self.order):
+            self.nested_counts[bag] = sum(
+                child_count + child_count * self.nested_counts[child_bag]
+                for child_bag, child_count in bag.can_contain_bags.items())
+
+    @staticmethod
+    def topological_order(bags) -> typing.List[Bag]:
+        parents_left = {bag: len(bag.can_be_contained_by_bags)
+                        for bag in bags}
+        ready = [bag for bag, parents in parents_left.items()
+                 if parents == 0]
+        order = []
+        while ready:
+            bag = ready.pop()
+            order.append(bag)
+            for child in bag.can_contain_bags:
+                parents_left[child] -= 1
+                if parents_left[child] == 0:
+                    ready.append(child)
+
+        if len(order) != len(parents_left):
+            raise ValueError("bags cannot contain themselves")
+        return order
+
+    def can_be_in(self, colour: str) -> frozenset:
+        return self.ancestors[self.bags[colour]]
+
+    def count_children(self, colour: str) -> int:
+        return self.nested_counts[self.bags[colour]]
+
+
 class DaySevenTests(unittest.TestCase):
 
     # def test_example_input_has_four_bags_that_could_contain_shiny_gold(self):
@@ -326,3 +378,35 @@ dark violet bags contain no other bags.
         gold_contains = bags['shiny gold'].count_children()
 
         self.assertEqual(gold_contains, 2976)
+
+    def test_graph_orders_parents_before_children(self):
+        bags = Bag.parse(example_input)
+        order = BagGraph(bags).order
+        self.assertEqual(len(order), 9)
+        for bag in order:
+            for child in bag.contained_bags():
+                self.assertLess(order.index(bag), order.index(child))
+
+    def test_graph_answers_example_input(self):
+        graph = BagGraph(Bag.parse(example_input))
+        self.assertEqual(len(graph.can_be_in('shiny gold')), 4)
+        self.assertEqual(graph.count_children('shiny gold'), 32)
+        self.assertEqual(graph.can_be_in('light red'), frozenset())
+
+    def test_graph_rejects_bags_that_contain_themselves(self):
+        bags = Bag.parse("""
+        light red bags contain 1 muted yellow bag.
+        muted yellow bags contain 2 light red bags.
+        """)
+        with self.assertRaises(ValueError):
+            BagGraph(bags)
+
+    def test_graph_answers_puzzle_input(self):
+        with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+            ss = content.read()
+        graph = BagGraph(Bag.parse(ss))
+
+        self.assertEqual(len(graph.can_be_in('shiny gold')), 246)
+        self.assertEqual(graph.count_children('shiny gold'), 2976)
+        for colour, bag in graph.bags.items():
+            self.assertEqual(graph.can_be_in(colour), bag.can_be_in())
@@ -0,0 +1,148 @@
+import numpy as np
+
+# one bit per question, a is bit 0 through to z at bit 25
+every_question = (1 << 26) - 1
+
+
+def encode_answers(answers: str) -> int:
+    mask = 0
+    for answer in answers:
+        if not 'a' <= answer <= 'z':
+            raise ValueError(f"{answers!r} has answers outside a-z")
+        mask |= 1 << (ord(answer) - ord('a'))
+    return mask
+
+
+def count_answers(mask: int) -> int:
+    # int.bit_count needs python 3.10
+    return bin(mask).count("1")
+
+
+def group_masks(group):
+    """(anyone said yes, everyone said yes) as bitmasks for a group"""
+    anyone = 0
+    everyone = every_question
+    for person in group:
+        answers = encode_answers(person)
+        anyone |= answers
+        everyone &= answers
+    return anyone, everyone
+
+
+def tally_groups(groups):
+    """the part one and part two totals together, in one pass"""
+    anyone_total = 0
+    everyone_total = 0
+    for group in groups:
+        anyone, everyone = group_masks(group)
+        anyone_total += count_answers(anyone)
+        everyone_total += count_answers(everyone)
+    return anyone_total, everyone_total
+
+
+class CustomsAggregator:
+    """consumes a customs form a line at a time.
+    only the current group's running union and intersection are kept,
+    so any size of file runs in constant memory"""
+
+    def __init__(self):
+        self.anyone_total = 0
+        self.everyone_total = 0
+        self._start_group()
+
+    def _start_group(self):
+        self.anyone = 0
+        self.everyone = every_question
+        self.people = 0
+
+    def add_line(self, line: str):
+        answers = line.strip()
+        if not answers:
+            self.end_group()
+            return
+        mask = encode_answers(answers)
+        self.anyone |= mask
+        self.everyone &= mask
+        self.people += 1
+
+    def end_group(self):
+        if self.people > 0:
+            self.anyone_total += count_answers(self.anyone)
+            self.everyone_total += count_answers(self.everyone)
+        self._start_group()
+
+    def totals(self):
+        """call at the end of the input, counts the last group if need be"""
+        self.end_group()
+        return self.anyone_total, self.everyone_total
+
+
+def aggregate_lines(lines):
+    aggregator = CustomsAggregator()
+    for line in lines:
+        aggregator.add_line(line)
+    return aggregator.totals()
+
+
+def tally_file(path):
+    with open(path) as content:
+        return aggregate_lines(content)
+
+
+def answer_matrix(lines):
+    """every person's answers as a (people x 26) bool matrix,
+    plus the row each group starts at"""
+    people = []
+    group_starts = []
+    in_group = False
+    for line in lines:
+        answers = line.strip()
+        if not answers:
+            in_group = False
+            continue
+        if not in_group:
+            group_starts.append(len(people))
+            in_group = True
+        people.append(answers)
+
+    all_answers = "".join(people)
+    if not all_answers.isascii():
+        # multi-byte characters would misalign letters with people
+        bad = next(p for p in people if not p.isascii())
+        raise ValueError(f"{bad!r} has answers outside a-z")
+
+    lengths = np.fromiter((len(p) for p in people), dtype=np.int64,
+                          count=len(people))
+    letters = np.frombuffer(all_answers.encode('ascii'), dtype=np.uint8)
+    person = np.repeat(np.arange(len(people)), lengths)
+
+    outside = (letters < ord('a')) | (letters > ord('z'))
+    if outside.any():
+        bad = people[person[np.argmax(outside)]]
+        raise ValueError(f"{bad!r} has answers outside a-z")
+
+    matrix = np.zeros((len(people), 26), dtype=bool)
+    matrix[person, letters - ord('a')] = True
+    return matrix, np.asarray(group_starts, dtype=np.int64)
+
+
+def group_answers(matrix, group_starts):
+    """(anyone said yes, everyone said yes) as (groups x 26) bool matrices"""
+    if len(group_starts) == 0:
+        empty = np.zeros((0, 26), dtype=bool)
+        return empty, empty
+    anyone = np.logical_or.reduceat(matrix, group_starts, axis=0)
+    everyone = np.logical_and.reduceat(matrix, group_starts, axis=0)
+    return anyone, everyone
+
+
+def question_frequencies(matrix, group_starts):
+    """for each question a..z, how many groups had anyone say yes
+    and how many had everyone say yes"""
+    anyone, everyone = group_answers(matrix, group_starts)
+    return anyone.sum(axis=0), everyone.sum(axis=0)
+
+
+def tally_vectorised(lines):
+    anyone, everyone = question_frequencies(*answer_matrix(lines))
+    return int(anyone.sum()), int(everyone.sum())
@@ -1,6 +1,18 @@
 import os
-from files.reader import get_puzzle_input_path, split_groups
+from files.reader import (get_puzzle_input_path,
+                          iter_groups,
+                          read_lines,
+                          split_groups)
 import unittest
+from day_six.customs import (aggregate_lines,
+                             answer_matrix,
+                             CustomsAggregator,
+                             encode_answers,
+                             group_masks,
+                             question_frequencies,
+                             tally_vectorised,
+                             tally_file,
+                             tally_groups)
 
 example_input = """
 abc
@@ -76,6 +88,22 @@ class DaySixTests(unittest.TestCase):
             ["b"]
         ])
 
+    def test_can_stream_groups_from_a_file(self):
+        path = get_puzzle_input_path(os.path.dirname(__file__))
+        with open(path) as content:
+            streamed = list(iter_groups(content))
+        with open(path) as content:
+            ss = content.read()
+        self.assertEqual(streamed, split_groups(ss))
+
+    def test_can_stream_groups_from_bytes_lines(self):
+        path = get_puzzle_input_path(os.path.dirname(__file__))
+        with open(path) as content:
+            expected = split_groups(content.read())
+        self.assertEqual(list(iter_groups(read_lines(path))), expected)
+        with open(path, 'rb') as content:
+            self.assertEqual(list(iter_groups(content)), expected)
+
     def test_can_any_yes_groups(self):
         groups = [
             ["abc"],
@@ -119,3 +147,66 @@ class DaySixTests(unittest.TestCase):
             ss = content.read()
         sum_of_counts = sum_counts(everyone_yes(split_groups(ss)))
         self.assertEqual(sum_of_counts, 3476)
+
+    def test_can_encode_answers_as_bits(self):
+        self.assertEqual(encode_answers("acz"), 0b1 | 0b100 | 1 << 25)
+        self.assertEqual(encode_answers(""), 0)
+
+    def test_answers_must_be_a_to_z(self):
+        for answers in ["aB", "a{", "a b", "é"]:
+            with self.assertRaisesRegex(ValueError, "outside a-z"):
+                encode_answers(answers)
+
+    def test_can_reduce_a_group_to_masks(self):
+        anyone, everyone = group_masks(["ab", "ac"])
+        self.assertEqual(anyone, encode_answers("abc"))
+        self.assertEqual(everyone, encode_answers("a"))
+
+    def test_can_tally_both_parts_of_example_input(self):
+        self.assertEqual(tally_groups(split_groups(example_input)), (11, 6))
+
+    def test_can_tally_both_parts_of_puzzle_input(self):
+        self.assertEqual(
+            tally_file(get_puzzle_input_path(os.path.dirname(__file__))),
+            (6686, 3476))
+
+    def test_can_aggregate_lines_of_example_input(self):
+        self.assertEqual(aggregate_lines(example_input.splitlines()),
+                         (11, 6))
+
+    def test_aggregator_only_counts_a_group_once_it_ends(self):
+        aggregator = CustomsAggregator()
+        aggregator.add_line("ab\n")
+        aggregator.add_line("ac\n")
+        self.assertEqual(aggregator.anyone_total, 0)
+        aggregator.add_line("\n")
+        aggregator.add_line("\n")
+        aggregator.add_line("z")
+        self.assertEqual(aggregator.totals(), (4, 2))
+
+    def test_can_build_an_answer_matrix(self):
+        matrix, group_starts = answer_matrix(["ab", "ac", "", "z"])
+        self.assertEqual(matrix.shape, (3, 26))
+        self.assertEqual(list(group_starts), [0, 2])
+        self.assertEqual(matrix[0, :3].tolist(), [True, True, False])
+        self.assertEqual(matrix[1, :3].tolist(), [True, False, True])
+        self.assertTrue(matrix[2, 25])
+
+    def test_answer_matrix_rejects_answers_outside_a_to_z(self):
+        for bad in ["aB", "a{", "é"]:
+            with self.assertRaisesRegex(ValueError, repr(bad)):
+                answer_matrix(["ab", "", bad, "c"])
+
+    def test_can_count_question_frequencies(self):
+        anyone, everyone = question_frequencies(
+            *answer_matrix(example_input.splitlines()))
+        self.assertEqual(anyone[:3].tolist(), [4, 4, 3])
+        self.assertEqual(everyone[:3].tolist(), [3, 2, 1])
+        self.assertEqual(anyone[3:].sum(), 0)
+
+    def test_vectorised_tally_of_puzzle_input(self):
+        with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+            self.assertEqual(tally_vectorised(content), (6686, 3476))
+
+    def test_vectorised_tally_of_nothing(self):
+        self.assertEqual(tally_vectorised([]), (0, 0))
@@ -1,7 +1,9 @@
 import unittest
+import numpy as np
 import data.sliding
 import os
-from files.reader import get_puzzle_input_path
+import tempfile
+from files.reader import get_puzzle_input_path, read_line_views, read_lines
 
 
 def organise_plugs(adapters):
@@ -24,17 +26,13 @@ def organise_plugs(adapters):
 
     adapter_order.append(device_joltage)
 
-    steps = data.sliding.window(adapter_order, 2)
-    counted_steps = [y - x for (x, y) in steps]
+    return count_steps(adapter_order)
 
-    seen_steps = {}
-    for counted_step in counted_steps:
-        if counted_step not in seen_steps:
-            seen_steps[counted_step] = 0
 
-        seen_steps[counted_step] = seen_steps[counted_step] + 1
-
-    return seen_steps
+def count_steps(adapter_order):
+    pairs = data.sliding.window_view(adapter_order, 2)
+    steps, counts = np.unique(pairs[:, 1] - pairs[:, 0], return_counts=True)
+    return {int(step): int(count) for step, count in zip(steps, counts)}
 
 
 class DayTenTests(unittest.TestCase):
@@ -57,6 +55,9 @@ class DayTenTests(unittest.TestCase):
 
         self.assertEqual(seen_joltage_steps, {1: 7, 3: 5})
 
+    def test_can_count_steps(self):
+        self.assertEqual(count_steps([0, 1, 4, 5, 6, 9]), {1: 3, 3: 2})
+
     def test_puzzle_input_part_one(self):
         with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
             puzzle_input = content.read().splitlines()
@@ -65,3 +66,32 @@ class DayTenTests(unittest.TestCase):
 
         self.assertEqual(seen_joltage_steps, {1: 73, 3: 31})
         self.assertEqual(seen_joltage_steps[1] * seen_joltage_steps[3], 2263)
+
+    def test_line_views_match_read_lines(self):
+        path = get_puzzle_input_path(os.path.dirname(__file__))
+        views = [int(v.tobytes()) for v in read_line_views(path)]
+        self.assertEqual(views, [int(line) for line in read_lines(path)])
+
+    def test_line_views_strip_carriage_returns(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'crlf.txt')
+            with open(path, 'wb') as f:
+                f.write(b"16\r\n10\r\n\r\n15")
+            views = [v.tobytes() for v in read_line_views(path)]
+            self.assertEqual(views, [b"16", b"10", b"", b"15"])
+            self.assertEqual(views, list(read_lines(path)))
+
+    def test_line_views_can_be_abandoned(self):
+        path = get_puzzle_input_path(os.path.dirname(__file__))
+        views = read_line_views(path)
+        first = next(views).tobytes()
+        views.close()
+        self.assertEqual(first, next(read_lines(path)))
+
+    def test_puzzle_input_part_one_from_mapped_file(self):
+        puzzle_input = read_lines(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+
+        seen_joltage_steps = organise_plugs(puzzle_input)
+
+        self.assertEqual(seen_joltage_steps, {1: 73, 3: 31})
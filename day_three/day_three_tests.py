@@ -4,6 +4,13 @@ from dataclasses import dataclass
 from functools import reduce
 import operator
 import os
+from day_three.toboggan import (count_trees,
+                                count_trees_for_slopes,
+                                count_trees_in_stream,
+                                count_trees_for_slope_grid,
+                                count_trees_vectorised,
+                                tree_array,
+                                TreeMap)
 
 
 @dataclass
@@ -40,8 +47,7 @@ def walk_the_map(map, x_step=3, y_step=1):
 
 
 def count_trees_encountered(map, x_step, y_step):
-    map_encounters = walk_the_map(map, x_step, y_step)
-    return sum(1 for x in map_encounters if x.encountered == "#")
+    return count_trees(TreeMap(map), x_step, y_step)
 
 
 class DayThreeTests(unittest.TestCase):
@@ -116,6 +122,26 @@ class DayThreeTests(unittest.TestCase):
             trees_encountered,
             292)
 
+    def test_tree_map_packs_one_byte_per_square(self):
+        tree_map = TreeMap(["#.#", "..#"])
+        self.assertEqual(tree_map.rows, [b"\x01\x00\x01", b"\x00\x00\x01"])
+        self.assertTrue(tree_map.has_tree(3, 0))
+        self.assertFalse(tree_map.has_tree(4, 1))
+
+    def test_count_trees_agrees_with_walking_the_map(self):
+        with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+            map = [line.rstrip() for line in content]
+        tree_map = TreeMap(map)
+        for x_step, y_step in [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2), (2, 3)]:
+            walked = sum(1 for x in walk_the_map(map, x_step, y_step)
+                         if x.encountered == "#")
+            self.assertEqual(count_trees(tree_map, x_step, y_step), walked)
+
+    def test_tree_map_from_file(self):
+        tree_map = TreeMap.from_file(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        self.assertEqual(count_trees(tree_map), 292)
+
     def test_example_part_two(self):
         map = ["..##.......",
                "#...#...#..",
@@ -153,6 +179,57 @@ class DayThreeTests(unittest.TestCase):
 
         self.assertEqual(reduce(operator.mul, different_slopes), 9354744432)
 
+    def test_can_count_all_slopes_in_one_pass(self):
+        map = ["..##.......",
+               "#...#...#..",
+               ".#....#..#.",
+               "..#.#...#.#",
+               ".#...##..#.",
+               "..#.##.....",
+               ".#.#.#....#",
+               ".#........#",
+               "#.##...#...",
+               "#...##....#",
+               ".#..#...#.#"]
+        slopes = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+        self.assertEqual(count_trees_for_slopes(TreeMap(map), slopes),
+                         [2, 7, 3, 4, 2])
+
+    def test_puzzle_input_part_two_in_one_pass(self):
+        tree_map = TreeMap.from_file(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        slopes = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+        different_slopes = count_trees_for_slopes(tree_map, slopes)
+        self.assertEqual(reduce(operator.mul, different_slopes), 9354744432)
+
+    def test_puzzle_input_part_two_streamed_from_file(self):
+        slopes = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+        with open(get_puzzle_input_path(os.path.dirname(__file__))) as content:
+            different_slopes = count_trees_in_stream(content, slopes)
+        self.assertEqual(reduce(operator.mul, different_slopes), 9354744432)
+
+    def test_vectorised_counts_agree_with_walking(self):
+        tree_map = TreeMap.from_file(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        grid = tree_array(tree_map)
+        self.assertEqual(grid.shape, (tree_map.height, tree_map.width))
+        for x_step, y_step in [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2), (2, 3)]:
+            self.assertEqual(count_trees_vectorised(grid, x_step, y_step),
+                             count_trees(tree_map, x_step, y_step))
+
+    def test_can_count_a_grid_of_slopes(self):
+        tree_map = TreeMap.from_file(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        x_steps = list(range(0, 40))
+        y_steps = [1, 2, 3, 7]
+        counts = count_trees_for_slope_grid(tree_array(tree_map),
+                                            x_steps, y_steps)
+        self.assertEqual(counts.shape, (4, 40))
+        for i, y_step in enumerate(y_steps):
+            for j, x_step in enumerate(x_steps):
+                self.assertEqual(counts[i, j],
+                                 count_trees(tree_map, x_step, y_step))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,103 @@
+import numpy as np
+
+from files.reader import read_lines
+
+# every byte maps to 0 apart from '#' which maps to 1
+tree_bytes = bytes(1 if b == ord('#') else 0 for b in range(256))
+
+
+def encode_row(row):
+    """one byte per square, 1 where there is a tree"""
+    if isinstance(row, str):
+        row = row.encode()
+    return row.rstrip(b'\r\n').translate(tree_bytes)
+
+
+class TreeMap:
+    """the map as one compact bytes row per line"""
+
+    def __init__(self, rows):
+        self.rows = [encode_row(row) for row in rows]
+        self.width = len(self.rows[0])
+        self.height = len(self.rows)
+
+    @classmethod
+    def from_file(class_, path):
+        return class_(line for line in read_lines(path) if line)
+
+    def has_tree(self, x, y):
+        return self.rows[y][x % self.width] == 1
+
+
+def count_trees(tree_map, x_step=3, y_step=1):
+    """the nth step lands on row n * y_step at column n * x_step,
+    so the count is a sum over those squares with no walking state"""
+    rows = tree_map.rows
+    width = tree_map.width
+    return sum(rows[y][(step * x_step) % width]
+               for step, y in enumerate(range(y_step, len(rows), y_step),
+                                        start=1))
+
+
+class SlopeWalker:
+    """follows one slope down the map as rows arrive,
+    keeping nothing but its count of trees"""
+
+    def __init__(self, x_step, y_step):
+        self.x_step = x_step
+        self.y_step = y_step
+        self.trees = 0
+
+    def see(self, y, row):
+        if y > 0 and y % self.y_step == 0:
+            self.trees += row[(y // self.y_step * self.x_step) % len(row)]
+
+
+def walk_rows(rows, slopes):
+    walkers = [SlopeWalker(x_step, y_step) for x_step, y_step in slopes]
+    for y, row in enumerate(rows):
+        for walker in walkers:
+            walker.see(y, row)
+    return [walker.trees for walker in walkers]
+
+
+def count_trees_for_slopes(tree_map, slopes):
+    """evaluates every (x_step, y_step) slope in a single pass
+    down the rows, returning the counts in the order of slopes"""
+    return walk_rows(tree_map.rows, slopes)
+
+
+def count_trees_in_stream(lines, slopes):
+    """like count_trees_for_slopes but over any iterable of lines,
+    e.g. an open file. only the current row is ever held"""
+    rows = (encode_row(line) for line in lines)
+    return walk_rows((row for row in rows if row), slopes)
+
+
+def tree_array(tree_map):
+    """the map as a 2d uint8 array, indexed [y, x]"""
+    return np.frombuffer(b"".join(tree_map.rows),
+                         dtype=np.uint8).reshape(tree_map.height,
+                                                 tree_map.width)
+
+
+def count_trees_vectorised(grid, x_step=3, y_step=1):
+    landed_rows = grid[y_step::y_step]
+    steps = np.arange(1, len(landed_rows) + 1)
+    columns = (steps * x_step) % grid.shape[1]
+    return int(landed_rows[np.arange(len(landed_rows)), columns].sum())
+
+
+def count_trees_for_slope_grid(grid, x_steps, y_steps):
+    """tree counts for every combination of x_steps and y_steps,
+    as an array indexed [y_step index, x_step index].
+    each y_step counts all of the x_steps with one gather"""
+    x_steps = np.asarray(x_steps)
+    counts = np.zeros((len(y_steps), len(x_steps)), dtype=np.int64)
+    for i, y_step in enumerate(y_steps):
+        landed_rows = grid[y_step::y_step]
+        steps = np.arange(1, len(landed_rows) + 1)
+        columns = (steps[:, None] * x_steps[None, :]) % grid.shape[1]
+        rows = np.arange(len(landed_rows))[:, None]
+        counts[i] = landed_rows[rows, columns].sum(axis=0)
+    return counts
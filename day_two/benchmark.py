@@ -0,0 +1,35 @@
+"""times the regex and counting password engines against each other.
+
+    python -m day_two.benchmark [number_of_lines]
+
+lines are the puzzle input repeated to the requested length"""
+import itertools
+import os
+import sys
+import timeit
+
+from day_two.day_two_tests import (checkPasswordValidity,
+                                   checkPasswordValidityPartTwo,
+                                   clearPolicyCache,
+                                   read_from_file)
+from files.reader import get_puzzle_input_path
+
+
+def main(number_of_lines):
+    puzzle_input = read_from_file(
+        get_puzzle_input_path(os.path.dirname(__file__)))
+    lines = list(itertools.islice(itertools.cycle(puzzle_input),
+                                  number_of_lines))
+
+    for part, check in [("part one", checkPasswordValidity),
+                        ("part two", checkPasswordValidityPartTwo)]:
+        for engine in ["regex", "counting"]:
+            clearPolicyCache()
+            seconds = timeit.timeit(lambda: check(lines, engine=engine),
+                                    number=1)
+            print(f"{part} {engine:>8}: {seconds * 1000:10.3f} ms "
+                  f"for {number_of_lines} lines")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
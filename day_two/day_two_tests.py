@@ -1,43 +1,78 @@
-from files.reader import get_puzzle_input_path
+from files.reader import get_puzzle_input_path, line_aligned_chunks
 import unittest
 import re
 import os
+from functools import lru_cache
+from day_two.policy import (countPolicyIsMet,
+                            countValidPasswordsInFile,
+                            parseRecord,
+                            PasswordRecord,
+                            positionPolicyIsMet)
 
 
-def ruleFrom(s):
+# the number of distinct policies is tiny compared to the number of lines
+# so each one is only compiled once
+policy_cache_size = 1024
+
+
+def policyFrom(s):
     x = s.split(":")[0].split(" ")
     letter = x[1]
     counts = x[0].split('-')
+    return int(counts[0]), int(counts[1]), letter
+
+
+@lru_cache(maxsize=policy_cache_size)
+def compiledRule(lower, upper, letter):
     pattern = (
-        f"^(?:[^{letter}]*[{letter}]){{{counts[0]},{counts[1]}}}"
+        f"^(?:[^{letter}]*[{letter}]){{{lower},{upper}}}"
         f"[^{letter}]*$"
     )
     try:
         rule = re.compile(pattern)
     except Exception:
-        print(f"could not compile: {pattern} generated from rule: {x}")
+        print(f"could not compile: {pattern} generated from rule: "
+              f"{(lower, upper, letter)}")
         raise
     else:
-        # print(f"compiled {pattern} from {x}")
         return rule
 
 
-def partTwoRulesFrom(s):
-    x = s.split(":")[0].split(" ")
-    letter = x[1]
-    counts = [int(z) for z in x[0].split('-')]
-    patterns = [f"^.{{{counts[0]-1}}}{letter}",
-                f"^.{{{counts[1]-1}}}{letter}"]
+@lru_cache(maxsize=policy_cache_size)
+def compiledPartTwoRules(first, second, letter):
+    patterns = [f"^.{{{first-1}}}{letter}",
+                f"^.{{{second-1}}}{letter}"]
     try:
-        rules = [re.compile(p) for p in patterns]
+        rules = tuple(re.compile(p) for p in patterns)
     except Exception:
-        print(f"could not compile: {patterns} generated from rule: {x}")
+        print(f"could not compile: {patterns} generated from rule: "
+              f"{(first, second, letter)}")
         raise
     else:
-        # print(f"compiled {pattern} from {x}")
         return rules
 
 
+def ruleFrom(s):
+    return compiledRule(*policyFrom(s))
+
+
+def partTwoRulesFrom(s):
+    return compiledPartTwoRules(*policyFrom(s))
+
+
+def policyCacheInfo():
+    """hits and misses for the compiled policy caches"""
+    return {
+        "part_one": compiledRule.cache_info(),
+        "part_two": compiledPartTwoRules.cache_info()
+    }
+
+
+def clearPolicyCache():
+    compiledRule.cache_clear()
+    compiledPartTwoRules.cache_clear()
+
+
 def passwordFrom(s):
     p = s.split(":")
     return p[1].strip()
@@ -53,16 +88,30 @@ def passwordIsValidPartTwo(password, rules):
     return len(results) == 2 and sum(x is not None for x in results) == 1
 
 
-def checkPasswordValidity(examples):
+partOneEngines = {
+    "regex": lambda x: passwordIsValid(passwordFrom(x), ruleFrom(x)),
+    "counting": lambda x: countPolicyIsMet(parseRecord(x))
+}
+
+partTwoEngines = {
+    "regex": lambda x: passwordIsValidPartTwo(
+        passwordFrom(x), partTwoRulesFrom(x)),
+    "counting": lambda x: positionPolicyIsMet(parseRecord(x))
+}
+
+
+def checkPasswordValidity(examples, engine="regex"):
+    isValid = partOneEngines[engine]
     return [x for x
             in examples
-            if passwordIsValid(passwordFrom(x), ruleFrom(x))]
+            if isValid(x)]
 
 
-def checkPasswordValidityPartTwo(examples):
+def checkPasswordValidityPartTwo(examples, engine="regex"):
+    isValid = partTwoEngines[engine]
     return [x for x
             in examples
-            if passwordIsValidPartTwo(passwordFrom(x), partTwoRulesFrom(x))]
+            if isValid(x)]
 
 
 def read_from_file(f):
@@ -94,6 +143,66 @@ class DayTwoTests(unittest.TestCase):
         validPasswords = checkPasswordValidity(policyExamples)
         self.assertEqual(len(validPasswords), 536)
 
+    def test_each_policy_is_compiled_once(self):
+        clearPolicyCache()
+        checkPasswordValidity(["1-3 a: abcde", "1-3 a: aaa", "2-9 c: ccc"])
+        checkPasswordValidityPartTwo(["1-3 a: abcde", "1-3 a: aaa"])
+
+        info = policyCacheInfo()
+        self.assertEqual(info["part_one"].misses, 2)
+        self.assertEqual(info["part_one"].hits, 1)
+        self.assertEqual(info["part_two"].misses, 1)
+        self.assertEqual(info["part_two"].hits, 1)
+
+    def test_can_parse_a_record_in_one_pass(self):
+        self.assertEqual(parseRecord("11-14 z: zzzzzzvzzxbzzzh"),
+                         PasswordRecord(11, 14, "z", "zzzzzzvzzxbzzzh"))
+
+    def test_counting_engine_matches_examples(self):
+        policyExamples = ["1-3 a: abcde", "1-3 b: cdefg", "2-9 c: ccccccccc"]
+        self.assertEqual(
+            checkPasswordValidity(policyExamples, engine="counting"),
+            ["1-3 a: abcde", "2-9 c: ccccccccc"])
+        self.assertEqual(
+            checkPasswordValidityPartTwo(policyExamples, engine="counting"),
+            ["1-3 a: abcde"])
+
+    def test_position_policy_beyond_end_of_password(self):
+        self.assertTrue(positionPolicyIsMet(parseRecord("1-9 a: abc")))
+        self.assertFalse(positionPolicyIsMet(parseRecord("8-9 a: abc")))
+
+    def test_counting_engine_with_puzzle_input(self):
+        policyExamples = read_from_file(
+            get_puzzle_input_path(os.path.dirname(__file__)))
+        self.assertEqual(
+            len(checkPasswordValidity(policyExamples, engine="counting")),
+            536)
+        self.assertEqual(
+            len(checkPasswordValidityPartTwo(
+                policyExamples, engine="counting")),
+            558)
+
+    def test_chunks_end_at_line_boundaries(self):
+        path = get_puzzle_input_path(os.path.dirname(__file__))
+        chunks = line_aligned_chunks(path, 1000)
+        with open(path, 'rb') as f:
+            content = f.read()
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], len(content))
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(content[end-1:end], b'\n')
+
+    def test_parallel_validation_with_puzzle_input(self):
+        path = get_puzzle_input_path(os.path.dirname(__file__))
+        self.assertEqual(
+            countValidPasswordsInFile(path, workers=2, chunkSize=1000), 536)
+        self.assertEqual(
+            countValidPasswordsInFile(
+                path, part=2, workers=2, chunkSize=1000),
+            558)
+
     def test_part_two_rule_example_one(self):
         example = "1-3 a: abcde"
         rule = partTwoRulesFrom(example)
@@ -0,0 +1,56 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from files.reader import line_aligned_chunks, read_lines
+
+
+class PasswordRecord(NamedTuple):
+    lower: int
+    upper: int
+    letter: str
+    password: str
+
+
+def parseRecord(s):
+    """splits "1-3 a: abcde" into its parts in one pass over the line"""
+    policy, _, password = s.partition(":")
+    counts, _, letter = policy.partition(" ")
+    lower, _, upper = counts.partition("-")
+    return PasswordRecord(int(lower), int(upper), letter, password.strip())
+
+
+def countPolicyIsMet(record):
+    occurrences = record.password.count(record.letter)
+    return record.lower <= occurrences <= record.upper
+
+
+def positionPolicyIsMet(record):
+    password = record.password
+    first = password[record.lower-1:record.lower] == record.letter
+    second = password[record.upper-1:record.upper] == record.letter
+    return first != second
+
+
+policies = {
+    1: countPolicyIsMet,
+    2: positionPolicyIsMet
+}
+
+
+def countValidPasswordsInChunk(path, start, end, part=1):
+    isValid = policies[part]
+    return sum(1 for line in read_lines(path, start, end)
+               if line.strip() and isValid(parseRecord(line.decode())))
+
+
+def countValidPasswordsInFile(path, part=1, workers=None,
+                              chunkSize=8 * 1024 * 1024):
+    """splits the file at line boundaries and validates each chunk in a
+    worker process. only counts come back from the workers, so memory
+    stays flat however big the file is"""
+    chunks = line_aligned_chunks(path, chunkSize)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = [executor.submit(countValidPasswordsInChunk,
+                                  path, start, end, part)
+                  for start, end in chunks]
+        return sum(c.result() for c in counts)
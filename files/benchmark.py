@@ -0,0 +1,66 @@
+"""compares peak memory of the list based and streaming grouped readers.
+
+    python -m files.benchmark [number_of_groups]
+
+each reader runs in its own process so the reported max RSS
+only reflects that reader"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from files.reader import iter_grouped_input, split_grouped_input
+
+record = ("ecl:gry pid:860033327 eyr:2020 hcl:#fffffd\n"
+          "byr:1937 iyr:2017 cid:147 hgt:183cm\n"
+          "\n")
+
+
+def count_with_lists(path):
+    with open(path) as content:
+        return len(split_grouped_input(content.read()))
+
+
+def count_with_stream(path):
+    with open(path) as content:
+        return sum(1 for _ in iter_grouped_input(content))
+
+
+readers = {
+    'list': count_with_lists,
+    'stream': count_with_stream,
+}
+
+
+def peak_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def write_input(path, number_of_groups):
+    with open(path, 'w') as f:
+        for _ in range(number_of_groups):
+            f.write(record)
+
+
+def run_one(reader, path):
+    count = readers[reader](path)
+    print(f"{reader}: {count} groups, peak rss {peak_rss_kb()} KiB")
+
+
+def main(number_of_groups):
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'grouped_input.txt')
+        write_input(path, number_of_groups)
+        print(f"input is {os.path.getsize(path) // 1024} KiB")
+        for reader in readers:
+            subprocess.run(
+                [sys.executable, '-m', 'files.benchmark', reader, path],
+                check=True)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        run_one(sys.argv[1], sys.argv[2])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -1,28 +1,120 @@
+import mmap
 import os
+from contextlib import contextmanager
 
 
 def get_puzzle_input_path(dirname: str):
     return os.path.join(dirname, 'puzzle_input.txt')
 
 
-def split_groups(input: str):
-    groups = []
+@contextmanager
+def mapped_input(path: str):
+    """maps the file read-only so callers can slice it
+    without reading the whole thing into a python string.
+    an empty file can't be mapped so yields empty bytes instead"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                yield m
+
+
+def line_spans(buffer, start=0, end_of_buffer=None):
+    """yields the (start, end) offsets of each line in the buffer,
+    excluding the newline"""
+    if end_of_buffer is None:
+        end_of_buffer = len(buffer)
+    while start < end_of_buffer:
+        end = buffer.find(b'\n', start, end_of_buffer)
+        if end == -1:
+            end = end_of_buffer
+        yield start, end
+        start = end + 1
+
+
+def line_views(buffer):
+    """yields a zero-copy memoryview over each line in the buffer,
+    without the newline or a trailing carriage return.
+    each view is released when the next one is asked for, so copy out
+    anything that's needed later, e.g. with view.tobytes().
+    exhaust or close the generator before closing the buffer"""
+    with memoryview(buffer) as view:
+        for start, end in line_spans(buffer):
+            if end > start and buffer[end - 1] == ord('\r'):
+                end -= 1
+            with view[start:end] as line:
+                yield line
+
+
+def read_line_views(path: str):
+    """line_views over the mapped file, which is closed once the views are"""
+    with mapped_input(path) as m:
+        yield from line_views(m)
+
+
+def read_lines(path: str, start=0, end=None):
+    """lazily yields each line of the file as bytes, without newlines.
+    only the current line is ever copied out of the mapped file.
+    start and end are byte offsets, see line_aligned_chunks"""
+    with mapped_input(path) as m:
+        for start, end in line_spans(m, start, end):
+            yield m[start:end].rstrip(b'\r')
+
+
+def read_numbers(path: str):
+    """lazily yields one int per non-blank line of the file"""
+    with mapped_input(path) as m:
+        for start, end in line_spans(m):
+            digits = m[start:end]
+            if digits.strip():
+                yield int(digits)
+
+
+def line_aligned_chunks(path: str, chunk_size: int):
+    """splits the file into (start, end) byte offsets of roughly chunk_size
+    bytes each. every chunk ends just after a newline, or at end of file,
+    so no line is split between two chunks"""
+    size = os.path.getsize(path)
+    chunks = []
+    start = 0
+    with open(path, 'rb') as f:
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()
+            end = min(f.tell(), size)
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def iter_groups(lines):
+    """yields one group of stripped lines at a time from any iterable of
+    lines, e.g. an open file, so only the current group is held in memory.
+    bytes lines, e.g. from read_lines or a binary file, are decoded"""
     current = []
-    for line in input.splitlines():
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode()
+        line = line.rstrip('\r\n')
         if len(line) > 0:
             current.append(line.strip())
-        else:
-            if len(current) == 0:
-                pass
-            else:
-                groups.append(current)
-                current = []
+        elif len(current) > 0:
+            yield current
+            current = []
 
     if len(current) > 0:
-        groups.append(current)
+        yield current
+
+
+def iter_grouped_input(lines):
+    for group in iter_groups(lines):
+        yield " ".join(group).strip()
 
-    return groups
+
+def split_groups(input: str):
+    return list(iter_groups(input.splitlines()))
 
 
 def split_grouped_input(input: str):
-    return [" ".join(x).strip() for x in split_groups(input)]
+    return list(iter_grouped_input(input.splitlines()))